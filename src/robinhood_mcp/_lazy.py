@@ -0,0 +1,56 @@
+"""Deferred module imports.
+
+robin_stocks pulls in requests, urllib3, and a long tail of submodules at
+import time. None of that is needed for the MCP handshake, so the server
+binds robin_stocks modules through LazyModule proxies and only pays the
+import cost on the first tool call that actually talks to Robinhood.
+"""
+
+import importlib
+import threading
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Proxy that imports a module on first attribute access.
+
+    Attribute reads are forwarded to the real module, so call sites like
+    ``rh.stocks.get_quotes(...)`` and patch targets such as
+    ``robinhood_mcp.tools.rh.stocks.get_quotes`` work unchanged. Submodule
+    attributes are cached on the proxy after their first lookup.
+    """
+
+    def __init__(self, name: str, on_load: Callable[[ModuleType], None] | None = None) -> None:
+        self._lazy_name = name
+        self._lazy_on_load = on_load
+        self._lazy_module: ModuleType | None = None
+        self._lazy_lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        """Import the target module (once) and run the on_load hook."""
+        module = self._lazy_module
+        if module is not None:
+            return module
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module = importlib.import_module(self._lazy_name)
+                if self._lazy_on_load is not None:
+                    self._lazy_on_load(module)
+                self._lazy_module = module
+            return self._lazy_module
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._load(), attr)
+        if isinstance(value, ModuleType):
+            # Submodules (rh.stocks, rh.account, ...) are never rebound, so pin
+            # them on the proxy: later lookups are plain instance-dict hits
+            # that skip this hook. Functions are not pinned, so patching them
+            # on the real module keeps working.
+            self.__dict__[attr] = value
+        return value
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<LazyModule {self._lazy_name!r} ({state})>"
@@ -10,10 +10,11 @@ Key insight: robin_stocks' rh.login() handles verification_workflow
 INTERNALLY via _validate_sherrif_id — it never returns the workflow
 dict to the caller. The PyPI version of that function is broken
 (calls input() which blocks forever on a headless server). We
-monkey-patch it at import time with a polling-based version that
-sends a push notification and waits for mobile app approval.
+monkey-patch it when robin_stocks is first imported with a polling-based
+version that sends a push notification and waits for mobile app approval.
 """
 
+import functools
 import inspect
 import io
 import logging
@@ -21,24 +22,59 @@ import os
 import sys
 import time
 from contextlib import redirect_stdout
+from types import ModuleType
 from typing import Any
 
 import pyotp
-import robin_stocks.robinhood as rh
-import robin_stocks.robinhood.authentication as rh_auth
 from dotenv import load_dotenv
-from robin_stocks.robinhood.helper import request_get, request_post
+
+from ._lazy import LazyModule
 
 logger = logging.getLogger(__name__)
 
+# robin_stocks is imported on first use, not at server startup (see _lazy.py).
+rh_helper = LazyModule("robin_stocks.robinhood.helper")
+rh_globals = LazyModule("robin_stocks.robinhood.globals")
+requests_exceptions = LazyModule("requests.exceptions")
+
 # How long the verification-workflow poll loops will block before failing.
 # 60 seconds is a forgiving window for a user to receive and tap the push
-# notification on their phone, but short enough that the single-threaded MCP
-# server doesn't freeze for minutes if approval never arrives. Override via
+# notification on their phone, but short enough that tool calls queued behind
+# the login lock don't stall for minutes if approval never arrives. Override via
 # the ROBINHOOD_APPROVAL_TIMEOUT env var (seconds, float).
 _DEFAULT_APPROVAL_TIMEOUT_SECONDS = 60.0
 _MIN_APPROVAL_TIMEOUT_SECONDS = 5.0
 
+# The .env file only needs to seed os.environ once per process; re-parsing it
+# on every login (including session-expiry re-logins) is wasted disk IO.
+_DOTENV_LOADED = False
+
+
+def _load_env_once() -> None:
+    """Load variables from a local .env file, at most once per process."""
+    global _DOTENV_LOADED
+
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def _reset_dotenv_cache() -> None:
+    """Allow the next _load_env_once() call to re-read the .env file."""
+    global _DOTENV_LOADED
+
+    _DOTENV_LOADED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _env_creds() -> tuple[str | None, str | None, str | None]:
+    """Return (username, password, totp_secret) from the environment, read once."""
+    return (
+        os.getenv("ROBINHOOD_USERNAME"),
+        os.getenv("ROBINHOOD_PASSWORD"),
+        os.getenv("ROBINHOOD_TOTP_SECRET"),
+    )
+
 
 def _approval_timeout_seconds() -> float:
     """Return the configured device-approval poll window, in seconds."""
@@ -82,7 +118,7 @@ def _dict_or_empty(value: Any) -> dict[str, Any]:
 
 def _request_workflow_result(inquiries_url: str) -> str | None:
     """Ask Robinhood whether an approved challenge has finalized the workflow."""
-    inq_resp = request_post(
+    inq_resp = rh_helper.request_post(
         url=inquiries_url,
         payload={"sequence": 0, "user_input": {"status": "continue"}},
         json=True,
@@ -108,13 +144,13 @@ def _patched_validate_sherrif_id(
         "flow": "suv",
         "input": {"workflow_id": workflow_id},
     }
-    data = request_post(url=user_machine_url, payload=payload, json=True)
+    data = rh_helper.request_post(url=user_machine_url, payload=payload, json=True)
 
     if not isinstance(data, dict) or "id" not in data:
         raise AuthenticationError("Verification workflow failed — missing inquiry ID")
 
     inquiries_url = f"https://api.robinhood.com/pathfinder/inquiries/{data['id']}/user_view/"
-    res = request_get(inquiries_url)
+    res = rh_helper.request_get(inquiries_url)
     if not isinstance(res, dict):
         raise AuthenticationError("Verification workflow failed — missing inquiry details")
 
@@ -135,7 +171,7 @@ def _patched_validate_sherrif_id(
     # If TOTP mfa_code is available, try direct challenge response first
     if mfa_code:
         challenge_url = f"https://api.robinhood.com/challenge/{challenge_id}/respond/"
-        resp = request_post(url=challenge_url, payload={"response": mfa_code}, json=True)
+        resp = rh_helper.request_post(url=challenge_url, payload={"response": mfa_code}, json=True)
         if not isinstance(resp, dict):
             raise AuthenticationError("TOTP challenge response was empty")
         if resp.get("status") == "validated":
@@ -166,7 +202,7 @@ def _patched_validate_sherrif_id(
     start = time.time()
     while time.time() - start < approval_timeout:
         time.sleep(5)
-        status_res = request_get(url=prompts_url)
+        status_res = rh_helper.request_get(url=prompts_url)
         elapsed = int(time.time() - start)
         if not isinstance(status_res, dict):
             print(
@@ -195,25 +231,33 @@ def _patched_validate_sherrif_id(
     )
 
 
-# Apply the monkey-patch before any login calls
-_target = getattr(rh_auth, "_validate_sherrif_id", None)
-if callable(_target):
-    _params = tuple(inspect.signature(_target).parameters)
-    if _params[:2] == ("device_token", "workflow_id"):
-        rh_auth._validate_sherrif_id = _patched_validate_sherrif_id
+def _apply_sherrif_patch(_module: ModuleType) -> None:
+    """Install the patched workflow handler when robin_stocks is first imported."""
+    import robin_stocks.robinhood.authentication as rh_auth
+
+    target = getattr(rh_auth, "_validate_sherrif_id", None)
+    if callable(target):
+        params = tuple(inspect.signature(target).parameters)
+        if params[:2] == ("device_token", "workflow_id"):
+            rh_auth._validate_sherrif_id = _patched_validate_sherrif_id
+        else:
+            print(
+                "[robinhood-mcp] WARNING: unexpected _validate_sherrif_id "
+                f"signature {params}. Upstream robin_stocks API may have changed.",
+                file=sys.stderr,
+            )
     else:
         print(
-            "[robinhood-mcp] WARNING: unexpected _validate_sherrif_id "
-            f"signature {_params}. Upstream robin_stocks API may have changed.",
+            "[robinhood-mcp] WARNING: rh_auth._validate_sherrif_id not found "
+            "or not callable. The upstream robin_stocks API may have changed "
+            "— consider pinning or upgrading the dependency.",
             file=sys.stderr,
         )
-else:
-    print(
-        "[robinhood-mcp] WARNING: rh_auth._validate_sherrif_id not found "
-        "or not callable. The upstream robin_stocks API may have changed "
-        "— consider pinning or upgrading the dependency.",
-        file=sys.stderr,
-    )
+
+
+# Every login goes through this proxy, so the monkey-patch is always applied
+# before robin_stocks can reach its own _validate_sherrif_id.
+rh = LazyModule("robin_stocks.robinhood", on_load=_apply_sherrif_patch)
 
 
 # ---------------------------------------------------------------------------
@@ -221,14 +265,77 @@ else:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4)
+def _totp_for(secret: str) -> pyotp.TOTP:
+    """Return a reusable TOTP generator for a base32 secret."""
+    return pyotp.TOTP(secret)
+
+
+# A TOTP code only changes once per interval, so remember the last one and
+# skip the HMAC for repeat logins inside the same window. One entry is enough:
+# a new window simply overwrites it.
+_totp_code_cache: tuple[tuple[str, int], str] | None = None
+
+
 def get_totp_code(secret: str | None) -> str | None:
     """Generate TOTP code from a base32 authenticator-app secret."""
+    global _totp_code_cache
+
     if not secret:
         return None
     try:
-        return pyotp.TOTP(secret).now()
+        totp = _totp_for(secret)
+        window = int(time.time()) // totp.interval
+        key = (secret, window)
+        cached = _totp_code_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # Derive the code from the same window used as the cache key, so a
+        # call straddling a boundary can't cache the next window's code.
+        code = totp.at(window * totp.interval)
     except Exception as e:
         raise AuthenticationError(f"Failed to generate TOTP code: {e}") from e
+    _totp_code_cache = (key, code)
+    return code
+
+
+# Every tools.py call goes through robin_stocks' module-level requests.Session,
+# so it is the hot path for the whole server. robin_stocks already keeps it
+# alive; we mount a pooled adapter that also retries idempotent requests on
+# rate limiting and transient 5xx errors. raise_on_status=False hands the last
+# response back to robin_stocks so its own error handling still applies.
+_HTTP_SESSION_CONFIGURED = False
+
+
+def _configure_http_session() -> None:
+    """Tune robin_stocks' shared HTTPS session once per process."""
+    global _HTTP_SESSION_CONFIGURED
+
+    if _HTTP_SESSION_CONFIGURED:
+        return
+    # This is only a performance tweak: if an upstream change (e.g. to
+    # rh_globals.SESSION) breaks it, warn and log in with the default adapter.
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        session = rh_globals.SESSION
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+    except Exception as e:
+        print(
+            f"[robinhood-mcp] WARNING: could not tune HTTP session ({e}); "
+            "using robin_stocks defaults.",
+            file=sys.stderr,
+        )
+    _HTTP_SESSION_CONFIGURED = True
 
 
 def _clear_stale_pickle() -> None:
@@ -286,11 +393,12 @@ def login(
     Raises:
         AuthenticationError: If credentials are missing or login fails.
     """
-    load_dotenv()
+    _load_env_once()
 
-    username = username or os.getenv("ROBINHOOD_USERNAME")
-    password = password or os.getenv("ROBINHOOD_PASSWORD")
-    totp_secret = totp_secret or os.getenv("ROBINHOOD_TOTP_SECRET")
+    env_username, env_password, env_totp_secret = _env_creds()
+    username = username or env_username
+    password = password or env_password
+    totp_secret = totp_secret or env_totp_secret
 
     if not username or not password:
         raise EnvironmentVariablesError(
@@ -298,6 +406,7 @@ def login(
         )
 
     mfa_code = get_totp_code(totp_secret)
+    _configure_http_session()
 
     try:
         result = _login_with_captured_stdout(
@@ -341,9 +450,13 @@ def login(
 
 def logout() -> None:
     """Logout from Robinhood and clear session."""
+    # robin_stocks' logout is @login_required and raises a bare Exception when
+    # there is no session, so check the flag instead of catching everything.
+    if not rh_helper.LOGGED_IN:
+        return
     try:
         rh.logout()
-    except Exception:
+    except (requests_exceptions.RequestException, RuntimeError):
         pass
 
 
@@ -1,37 +1,45 @@
 """FastMCP server for Robinhood portfolio research."""
 
+import asyncio
 import math
 import sys
 import threading
 import time
-from typing import Literal
+from collections.abc import Callable
+from typing import Any, Literal
 
-from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from .auth import AuthenticationError, EnvironmentVariablesError, is_logged_in, login
+from .auth import (
+    AuthenticationError,
+    EnvironmentVariablesError,
+    is_logged_in,
+    login,
+)
 from .tools import (
     RobinhoodError,
+    clear_caches,
     get_accounts,
     get_dividends,
     get_earnings,
     get_fundamentals,
+    get_fundamentals_batch,
     get_historicals,
+    get_historicals_columnar,
     get_news,
     get_options_positions,
     get_order_history,
     get_portfolio,
     get_position,
     get_positions,
+    get_positions_with_quotes,
     get_quote,
+    get_quotes_batch,
     get_ratings,
     get_watchlist,
     search_symbols,
 )
 
-# Load environment variables
-load_dotenv()
-
 # Initialize FastMCP server (older versions don't accept description kwarg).
 try:
     mcp = FastMCP(
@@ -47,12 +55,18 @@ _login_error: str | None = None
 _login_lock = threading.Lock()
 _cached_login_status: bool | None = None
 _cached_login_status_ts = 0.0
-_LOGIN_STATUS_TTL_SECONDS = 5.0
+_LOGIN_STATUS_TTL_SECONDS = 30.0
+
+# FastMCP already runs sync tools in its threadpool, so concurrent calls
+# overlap either way. Tools are async only so they can share this semaphore,
+# which caps how many calls hit Robinhood's API at once.
+_MAX_CONCURRENT_TOOL_CALLS = 8
+_tool_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOL_CALLS)
 
 # Cache transient AuthenticationError failures so repeated tool calls don't
-# each re-run the full robin_stocks login flow — that flow can synchronously
-# block the (single-threaded) MCP server for tens of seconds while polling
-# for mobile-app device approval. With the cache, only the first call pays
+# each re-run the full robin_stocks login flow — that flow can block for tens
+# of seconds while polling for mobile-app device approval, holding the login
+# lock and stalling every other tool call behind it. With the cache, only the first call pays
 # the cost; subsequent calls within the cooldown window fail fast.
 _auth_failure_message: str | None = None
 _auth_failure_ts = 0.0
@@ -76,6 +90,19 @@ def _is_session_valid_cached() -> bool:
     return status
 
 
+def _invalidate_login_status() -> None:
+    """Forget the cached session status so the next call re-probes Robinhood.
+
+    Deliberately lock-free: this runs on the event loop, and _login_lock can
+    be held for the whole login flow (up to the device-approval timeout).
+    Either reset on its own already forces a fresh probe.
+    """
+    global _cached_login_status, _cached_login_status_ts
+
+    _cached_login_status = None
+    _cached_login_status_ts = 0.0
+
+
 def _ensure_logged_in() -> None:
     """Ensure we're logged in before API calls, re-attempting if session expired."""
     global _login_attempted, _login_error
@@ -131,19 +158,38 @@ def _ensure_logged_in() -> None:
                 raise RobinhoodError(f"Not logged in: {message}") from e
 
 
+async def _run_tool(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a tool function behind the login gate, at most 8 at a time.
+
+    Holds a ``_tool_semaphore`` slot for the whole call. The login check and
+    the tool both block on HTTPS, so they run via asyncio.to_thread, as
+    FastMCP would do for a sync tool.
+
+    Any RobinhoodError from the tool itself drops the cached session status,
+    so an expired session is re-detected on the next call instead of being
+    trusted for the rest of the TTL window.
+    """
+    async with _tool_semaphore:
+        await asyncio.to_thread(_ensure_logged_in)
+        try:
+            return await asyncio.to_thread(func, *args)
+        except RobinhoodError:
+            _invalidate_login_status()
+            raise
+
+
 @mcp.tool()
-def robinhood_get_accounts() -> list:
+async def robinhood_get_accounts() -> list:
     """List available Robinhood accounts for account_number selection.
 
     Use this to find account numbers for account-scoped tools when a Robinhood
     login has multiple accounts, such as a taxable account and IRA.
     """
-    _ensure_logged_in()
-    return get_accounts()
+    return await _run_tool(get_accounts)
 
 
 @mcp.tool()
-def robinhood_get_portfolio(account_number: str | None = None) -> dict:
+async def robinhood_get_portfolio(account_number: str | None = None) -> dict:
     """Get current portfolio value and performance metrics.
 
     Args:
@@ -152,12 +198,11 @@ def robinhood_get_portfolio(account_number: str | None = None) -> dict:
     Returns portfolio profile with equity, extended hours equity,
     withdrawable amount, and other account details.
     """
-    _ensure_logged_in()
-    return get_portfolio(account_number)
+    return await _run_tool(get_portfolio, account_number)
 
 
 @mcp.tool()
-def robinhood_get_positions(account_number: str | None = None) -> dict:
+async def robinhood_get_positions(account_number: str | None = None) -> dict:
     """Get all current stock positions with details.
 
     Args:
@@ -166,12 +211,27 @@ def robinhood_get_positions(account_number: str | None = None) -> dict:
     Returns a dict mapping stock symbols to position details including
     price, quantity, average buy price, equity, and percent change.
     """
-    _ensure_logged_in()
-    return get_positions(account_number)
+    return await _run_tool(get_positions, account_number)
+
+
+@mcp.tool()
+async def robinhood_get_positions_with_quotes(account_number: str | None = None) -> dict:
+    """Get all current stock positions together with their real-time quotes.
+
+    Prefer this over robinhood_get_positions followed by one
+    robinhood_get_quote call per holding: all quotes are fetched in one request.
+
+    Args:
+        account_number: Optional Robinhood account number. Omit for the default account.
+
+    Returns a dict mapping stock symbols to position details (price, quantity,
+    average buy price, equity, percent change) plus a "quote" entry.
+    """
+    return await _run_tool(get_positions_with_quotes, account_number)
 
 
 @mcp.tool()
-def robinhood_get_position(symbol: str, account_number: str | None = None) -> dict:
+async def robinhood_get_position(symbol: str, account_number: str | None = None) -> dict:
     """Get one current stock position with a faster single-symbol lookup.
 
     Args:
@@ -181,12 +241,11 @@ def robinhood_get_position(symbol: str, account_number: str | None = None) -> di
     Returns a dict with held=False if absent, otherwise the position details
     for that symbol including quantity, price, average buy price, and P&L.
     """
-    _ensure_logged_in()
-    return get_position(symbol, account_number)
+    return await _run_tool(get_position, symbol, account_number)
 
 
 @mcp.tool()
-def robinhood_get_watchlist(name: str = "Default") -> list:
+async def robinhood_get_watchlist(name: str = "Default") -> list:
     """Get stocks in a watchlist.
 
     Args:
@@ -194,12 +253,11 @@ def robinhood_get_watchlist(name: str = "Default") -> list:
 
     Returns list of watchlist items with instrument details.
     """
-    _ensure_logged_in()
-    return get_watchlist(name)
+    return await _run_tool(get_watchlist, name)
 
 
 @mcp.tool()
-def robinhood_get_quote(symbol: str) -> dict:
+async def robinhood_get_quote(symbol: str) -> dict:
     """Get real-time quote for a stock symbol.
 
     Args:
@@ -208,12 +266,26 @@ def robinhood_get_quote(symbol: str) -> dict:
     Returns quote data including last trade price, bid, ask,
     previous close, and trading status.
     """
-    _ensure_logged_in()
-    return get_quote(symbol)
+    return await _run_tool(get_quote, symbol)
 
 
 @mcp.tool()
-def robinhood_get_fundamentals(symbol: str) -> dict:
+async def robinhood_get_quotes(symbols: list[str]) -> dict:
+    """Get real-time quotes for several stock symbols in one request.
+
+    Prefer this over calling robinhood_get_quote in a loop.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ["AAPL", "TSLA"])
+
+    Returns a dict mapping each found symbol to its quote data.
+    Unknown symbols are omitted.
+    """
+    return await _run_tool(get_quotes_batch, symbols)
+
+
+@mcp.tool()
+async def robinhood_get_fundamentals(symbol: str) -> dict:
     """Get fundamental data for a stock.
 
     Args:
@@ -222,12 +294,26 @@ def robinhood_get_fundamentals(symbol: str) -> dict:
     Returns fundamentals including P/E ratio, market cap,
     dividend yield, 52-week high/low, and more.
     """
-    _ensure_logged_in()
-    return get_fundamentals(symbol)
+    return await _run_tool(get_fundamentals, symbol)
 
 
 @mcp.tool()
-def robinhood_get_historicals(
+async def robinhood_get_fundamentals_batch(symbols: list[str]) -> dict:
+    """Get fundamental data for several stocks in one request.
+
+    Prefer this over calling robinhood_get_fundamentals in a loop.
+
+    Args:
+        symbols: Stock ticker symbols
+
+    Returns a dict mapping each found symbol to its fundamentals.
+    Unknown symbols are omitted.
+    """
+    return await _run_tool(get_fundamentals_batch, symbols)
+
+
+@mcp.tool()
+async def robinhood_get_historicals(
     symbol: str,
     interval: Literal["5minute", "10minute", "hour", "day", "week"] = "day",
     span: Literal["day", "week", "month", "3month", "year", "5year"] = "month",
@@ -241,12 +327,33 @@ def robinhood_get_historicals(
 
     Returns list of OHLCV data points (open, high, low, close, volume).
     """
-    _ensure_logged_in()
-    return get_historicals(symbol, interval, span)
+    return await _run_tool(get_historicals, symbol, interval, span)
 
 
 @mcp.tool()
-def robinhood_get_news(symbol: str) -> list:
+async def robinhood_get_historicals_columnar(
+    symbol: str,
+    interval: Literal["5minute", "10minute", "hour", "day", "week"] = "day",
+    span: Literal["day", "week", "month", "3month", "year", "5year"] = "month",
+) -> dict:
+    """Get historical price data for a stock in compact column form.
+
+    Prefer this over robinhood_get_historicals for long spans or charting:
+    each field is one list, so the response is much smaller.
+
+    Args:
+        symbol: Stock ticker symbol
+        interval: Time interval (5minute, 10minute, hour, day, week)
+        span: Time span (day, week, month, 3month, year, 5year)
+
+    Returns a dict with equal-length lists begins_at, open, high, low,
+    close (as numbers), and volume, plus the symbol, interval, and span.
+    """
+    return await _run_tool(get_historicals_columnar, symbol, interval, span)
+
+
+@mcp.tool()
+async def robinhood_get_news(symbol: str) -> list:
     """Get recent news articles for a stock.
 
     Args:
@@ -255,12 +362,11 @@ def robinhood_get_news(symbol: str) -> list:
     Returns list of news articles with title, URL, source,
     and publication date.
     """
-    _ensure_logged_in()
-    return get_news(symbol)
+    return await _run_tool(get_news, symbol)
 
 
 @mcp.tool()
-def robinhood_get_earnings(symbol: str) -> list:
+async def robinhood_get_earnings(symbol: str) -> list:
     """Get earnings data for a stock.
 
     Args:
@@ -269,12 +375,11 @@ def robinhood_get_earnings(symbol: str) -> list:
     Returns list of earnings reports with EPS, report date,
     analyst estimates, and actual vs expected.
     """
-    _ensure_logged_in()
-    return get_earnings(symbol)
+    return await _run_tool(get_earnings, symbol)
 
 
 @mcp.tool()
-def robinhood_get_ratings(symbol: str) -> dict:
+async def robinhood_get_ratings(symbol: str) -> dict:
     """Get analyst ratings summary for a stock.
 
     Args:
@@ -283,12 +388,11 @@ def robinhood_get_ratings(symbol: str) -> dict:
     Returns ratings summary with buy, hold, sell counts,
     and overall recommendation.
     """
-    _ensure_logged_in()
-    return get_ratings(symbol)
+    return await _run_tool(get_ratings, symbol)
 
 
 @mcp.tool()
-def robinhood_get_dividends(account_number: str | None = None) -> list:
+async def robinhood_get_dividends(account_number: str | None = None) -> list:
     """Get all dividend payments received.
 
     Args:
@@ -297,12 +401,11 @@ def robinhood_get_dividends(account_number: str | None = None) -> list:
     Returns list of dividend payments with amount, payable date,
     record date, and instrument details.
     """
-    _ensure_logged_in()
-    return get_dividends(account_number)
+    return await _run_tool(get_dividends, account_number)
 
 
 @mcp.tool()
-def robinhood_get_options_positions(account_number: str | None = None) -> list:
+async def robinhood_get_options_positions(account_number: str | None = None) -> list:
     """Get all current options positions (read-only).
 
     Args:
@@ -311,12 +414,11 @@ def robinhood_get_options_positions(account_number: str | None = None) -> list:
     Returns list of options positions with chain symbol, type,
     strike price, expiration, and quantity.
     """
-    _ensure_logged_in()
-    return get_options_positions(account_number)
+    return await _run_tool(get_options_positions, account_number)
 
 
 @mcp.tool()
-def robinhood_get_order_history(
+async def robinhood_get_order_history(
     symbol: str | None = None,
     state: Literal["executed", "all"] = "executed",
     limit: int = 50,
@@ -341,12 +443,11 @@ def robinhood_get_order_history(
     quantity, filled quantity, average price, type, timestamps, and per-fill
     executions.
     """
-    _ensure_logged_in()
-    return get_order_history(symbol, state, limit, start_date, account_number)
+    return await _run_tool(get_order_history, symbol, state, limit, start_date, account_number)
 
 
 @mcp.tool()
-def robinhood_search_symbols(query: str) -> list:
+async def robinhood_search_symbols(query: str) -> list:
     """Search for stock symbols by company name or ticker.
 
     Args:
@@ -355,8 +456,20 @@ def robinhood_search_symbols(query: str) -> list:
     Returns list of matching instruments with symbol, name,
     and other details.
     """
-    _ensure_logged_in()
-    return search_symbols(query)
+    return await _run_tool(search_symbols, query)
+
+
+@mcp.tool()
+def robinhood_clear_cache() -> dict:
+    """Clear cached quotes, fundamentals, earnings, ratings, and positions.
+
+    Cached data is reused for a short time (15s for quotes, 30s for
+    positions, up to 24h for earnings and ratings). Call this when you need
+    guaranteed-fresh numbers.
+
+    Returns a dict with cleared=True.
+    """
+    return clear_caches()
 
 
 def main() -> None:
@@ -7,7 +7,10 @@ from collections.abc import Callable
 from copy import deepcopy
 from typing import Any, Literal
 
-import robin_stocks.robinhood as rh
+from ._lazy import LazyModule
+
+rh = LazyModule("robin_stocks.robinhood")
+requests_exceptions = LazyModule("requests.exceptions")
 
 
 class RobinhoodError(Exception):
@@ -16,12 +19,76 @@ class RobinhoodError(Exception):
     pass
 
 
+_SYMBOL_ERROR = "Symbol must be a non-empty string"
+_INTERVALS = ("5minute", "10minute", "hour", "day", "week")
+_SPANS = ("day", "week", "month", "3month", "year", "5year")
+_VALID_INTERVALS = frozenset(_INTERVALS)
+_VALID_SPANS = frozenset(_SPANS)
+_INTERVAL_ERROR = "Invalid interval. Must be one of: " + ", ".join(_INTERVALS)
+_SPAN_ERROR = "Invalid span. Must be one of: " + ", ".join(_SPANS)
+
 _POSITIONS_CACHE_TTL_SECONDS = 30.0
 _ACCOUNT_NUMBER_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 _positions_cache_lock = threading.Lock()
 _positions_cache: dict[str | None, dict[str, dict[str, Any]]] = {}
 _positions_cache_ts: dict[str | None, float] = {}
 
+# Per-symbol response caches. Fundamentals, earnings, and analyst ratings
+# move on a daily/quarterly cadence, so re-fetching them on every tool call is
+# pure network latency; quotes get a short window that still collapses bursts
+# of repeated lookups.
+_QUOTE_CACHE_TTL_SECONDS = 15.0
+_FUNDAMENTALS_CACHE_TTL_SECONDS = 3600.0
+_EARNINGS_CACHE_TTL_SECONDS = 86400.0
+_RATINGS_CACHE_TTL_SECONDS = 86400.0
+_RESPONSE_CACHE_MAXSIZE = 512
+
+
+class _TTLCache:
+    """Small thread-safe TTL cache for per-symbol API responses.
+
+    Values are deep-copied on the way in and out, like the positions cache,
+    so callers can never mutate a cached entry.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = _RESPONSE_CACHE_MAXSIZE) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if (time.monotonic() - stored_at) >= self._ttl_seconds:
+                del self._entries[key]
+                return None
+            return deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry when the cache is full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), deepcopy(value))
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+_quote_cache = _TTLCache(_QUOTE_CACHE_TTL_SECONDS)
+_fundamentals_cache = _TTLCache(_FUNDAMENTALS_CACHE_TTL_SECONDS)
+_earnings_cache = _TTLCache(_EARNINGS_CACHE_TTL_SECONDS)
+_ratings_cache = _TTLCache(_RATINGS_CACHE_TTL_SECONDS)
+_RESPONSE_CACHES = (_quote_cache, _fundamentals_cache, _earnings_cache, _ratings_cache)
+
 
 def _safe_call(func: Callable[..., Any], *args, **kwargs) -> Any:
     """Safely call a robin_stocks function with error handling.
@@ -45,17 +112,75 @@ def _safe_call(func: Callable[..., Any], *args, **kwargs) -> Any:
     except RobinhoodError:
         raise
     except Exception as e:
+        # Deliberately broad: robin_stocks turns HTTP errors into None and then
+        # fails on it with TypeError, and @login_required raises a bare
+        # Exception. All of these must reach _run_tool as RobinhoodError so the
+        # cached session status is dropped. (KeyboardInterrupt and SystemExit
+        # derive from BaseException and are never caught here.)
         raise RobinhoodError(f"API call failed: {e}") from e
 
 
+def _as_list(value: Any) -> list[Any]:
+    """Return robin_stocks list payloads as-is and anything else as an empty list.
+
+    robin_stocks builds plain lists, so an exact type check is enough here.
+    """
+    return value if type(value) is list else []
+
+
 def _normalize_symbol(symbol: str) -> str:
     """Normalize and validate ticker symbols."""
-    if not symbol or not isinstance(symbol, str):
-        raise RobinhoodError("Symbol must be a non-empty string")
-    symbol = symbol.upper().strip()
-    if not symbol:
-        raise RobinhoodError("Symbol must be a non-empty string")
-    return symbol
+    if isinstance(symbol, str):
+        symbol = symbol.strip().upper()
+        if symbol:
+            return symbol
+    raise RobinhoodError(_SYMBOL_ERROR)
+
+
+def _normalize_symbols(symbols: list[str]) -> list[str]:
+    """Normalize, validate, and de-duplicate a list of ticker symbols."""
+    if not isinstance(symbols, list) or not symbols:
+        raise RobinhoodError("symbols must be a non-empty list of strings")
+    return list(dict.fromkeys(_normalize_symbol(symbol) for symbol in symbols))
+
+
+def _rows_by_symbol(rows: Any, symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Key batch API rows by symbol, keeping request order and dropping misses.
+
+    robin_stocks silently drops unknown tickers from batch responses, so rows
+    cannot be zipped positionally against the requested symbols.
+    """
+    if not isinstance(rows, list):
+        return {}
+    by_symbol = {row.get("symbol"): row for row in rows if isinstance(row, dict)}
+    return {symbol: by_symbol[symbol] for symbol in symbols if symbol in by_symbol}
+
+
+def _batch_cached(
+    cache: _TTLCache, func: Callable[..., Any], symbols: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Serve batch lookups from cache, fetching only the misses in one API call.
+
+    A failed or unauthorized request comes back from robin_stocks as [None].
+    That must surface as RobinhoodError (so _run_tool drops the cached
+    session status) rather than as an empty "every ticker unknown" result.
+    """
+    found: dict[str, dict[str, Any]] = {}
+    for symbol in symbols:
+        cached = cache.get(symbol)
+        if cached is not None:
+            found[symbol] = cached
+
+    missing = [symbol for symbol in symbols if symbol not in found]
+    if missing:
+        rows = _safe_call(func, missing)
+        if not isinstance(rows, list) or not any(isinstance(row, dict) for row in rows):
+            raise RobinhoodError(f"No data returned for symbols: {', '.join(missing)}")
+        fetched = _rows_by_symbol(rows, missing)
+        for symbol, row in fetched.items():
+            cache.set(symbol, row)
+        found.update(fetched)
+    return {symbol: found[symbol] for symbol in symbols if symbol in found}
 
 
 def _normalize_account_number(account_number: str | None) -> str | None:
@@ -80,6 +205,23 @@ def _account_kwargs(account_number: str | None) -> dict[str, str]:
     return {} if account_number is None else {"account_number": account_number}
 
 
+def _clear_response_caches() -> None:
+    """Reset the per-symbol quote, fundamentals, earnings, and ratings caches."""
+    for cache in _RESPONSE_CACHES:
+        cache.clear()
+
+
+def clear_caches() -> dict[str, bool]:
+    """Drop all cached Robinhood responses so the next calls fetch fresh data.
+
+    Returns:
+        Dict with cleared=True.
+    """
+    _clear_positions_cache()
+    _clear_response_caches()
+    return {"cleared": True}
+
+
 def _clear_positions_cache() -> None:
     """Reset the cached holdings snapshot."""
     global _positions_cache, _positions_cache_ts
@@ -289,6 +431,31 @@ def get_positions(account_number: str | None = None) -> dict[str, dict[str, Any]
         return _slim_positions(result)
 
 
+def get_positions_with_quotes(account_number: str | None = None) -> dict[str, dict[str, Any]]:
+    """Get all current stock positions, each with its full real-time quote.
+
+    Quotes for every held symbol are fetched in a single batch request
+    rather than one request per position.
+
+    Args:
+        account_number: Optional Robinhood account number. Omit for the default account.
+
+    Returns:
+        Dict mapping symbol to the get_positions() fields plus a "quote" key
+        holding the quote data (None if Robinhood returned no quote for that
+        symbol).
+
+    Raises:
+        RobinhoodError: If the batch quote request fails, rather than
+            returning every holding with a None quote.
+    """
+    positions = get_positions(account_number)
+    if not positions:
+        return {}
+    quotes = get_quotes_batch(list(positions))
+    return {symbol: {**data, "quote": quotes.get(symbol)} for symbol, data in positions.items()}
+
+
 def _position_payload(symbol: str, data: dict[str, Any]) -> dict[str, Any]:
     """Build a stable position response with a fixed set of fields."""
     fields = {k: data.get(k) for k in _POSITION_FIELDS}
@@ -362,7 +529,7 @@ def get_watchlist(name: str = "Default") -> list[dict[str, Any]]:
         List of watchlist items with instrument details.
     """
     result = _safe_call(rh.account.get_watchlist_by_name, name=name)
-    return result if isinstance(result, list) else []
+    return _as_list(result)
 
 
 def get_quote(symbol: str) -> dict[str, Any]:
@@ -375,13 +542,34 @@ def get_quote(symbol: str) -> dict[str, Any]:
         Quote data including last_trade_price, bid, ask, etc.
     """
     symbol = _normalize_symbol(symbol)
+    cached = _quote_cache.get(symbol)
+    if cached is not None:
+        return cached
+
     result = _safe_call(rh.stocks.get_quotes, symbol)
 
-    if isinstance(result, list) and len(result) > 0:
+    if type(result) is list and result:
+        _quote_cache.set(symbol, result[0])
         return result[0]
     raise RobinhoodError(f"No quote found for symbol: {symbol}")
 
 
+def get_quotes_batch(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Get real-time quotes for several symbols in a single API request.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ["AAPL", "TSLA"]).
+
+    Returns:
+        Dict mapping each found symbol to its quote data. Unknown symbols
+        are omitted.
+
+    Raises:
+        RobinhoodError: If the request fails or none of the symbols are found.
+    """
+    return _batch_cached(_quote_cache, rh.stocks.get_quotes, _normalize_symbols(symbols))
+
+
 def get_fundamentals(symbol: str) -> dict[str, Any]:
     """Get fundamental data for a stock.
 
@@ -392,13 +580,36 @@ def get_fundamentals(symbol: str) -> dict[str, Any]:
         Fundamentals including pe_ratio, market_cap, dividend_yield, etc.
     """
     symbol = _normalize_symbol(symbol)
+    cached = _fundamentals_cache.get(symbol)
+    if cached is not None:
+        return cached
+
     result = _safe_call(rh.stocks.get_fundamentals, symbol)
 
-    if isinstance(result, list) and len(result) > 0:
+    if type(result) is list and result:
+        _fundamentals_cache.set(symbol, result[0])
         return result[0]
     raise RobinhoodError(f"No fundamentals found for symbol: {symbol}")
 
 
+def get_fundamentals_batch(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """Get fundamental data for several symbols in a single API request.
+
+    Args:
+        symbols: Stock ticker symbols.
+
+    Returns:
+        Dict mapping each found symbol to its fundamentals. Unknown symbols
+        are omitted.
+
+    Raises:
+        RobinhoodError: If the request fails or none of the symbols are found.
+    """
+    return _batch_cached(
+        _fundamentals_cache, rh.stocks.get_fundamentals, _normalize_symbols(symbols)
+    )
+
+
 def get_historicals(
     symbol: str,
     interval: Literal["5minute", "10minute", "hour", "day", "week"] = "day",
@@ -416,16 +627,67 @@ def get_historicals(
     """
     symbol = _normalize_symbol(symbol)
 
-    valid_intervals = {"5minute", "10minute", "hour", "day", "week"}
-    valid_spans = {"day", "week", "month", "3month", "year", "5year"}
-
-    if interval not in valid_intervals:
-        raise RobinhoodError(f"Invalid interval. Must be one of: {valid_intervals}")
-    if span not in valid_spans:
-        raise RobinhoodError(f"Invalid span. Must be one of: {valid_spans}")
+    if interval not in _VALID_INTERVALS:
+        raise RobinhoodError(_INTERVAL_ERROR)
+    if span not in _VALID_SPANS:
+        raise RobinhoodError(_SPAN_ERROR)
 
     result = _safe_call(rh.stocks.get_stock_historicals, symbol, interval=interval, span=span)
-    return result if isinstance(result, list) else []
+    return _as_list(result)
+
+
+# Column name -> robin_stocks historicals row key. Price columns are parsed to
+# floats once here so clients don't re-parse Robinhood's numeric strings.
+_HISTORICAL_PRICE_COLUMNS = (
+    ("open", "open_price"),
+    ("high", "high_price"),
+    ("low", "low_price"),
+    ("close", "close_price"),
+)
+
+
+def _to_float(value: Any) -> float | None:
+    """Parse a Robinhood numeric string, returning None when it isn't numeric."""
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_historicals_columnar(
+    symbol: str,
+    interval: Literal["5minute", "10minute", "hour", "day", "week"] = "day",
+    span: Literal["day", "week", "month", "3month", "year", "5year"] = "month",
+) -> dict[str, Any]:
+    """Get historical price data for a stock as parallel columns.
+
+    Same data as get_historicals, but column-oriented: one list per field
+    instead of one dict per bar, which removes the repeated keys and per-row
+    metadata from the response.
+
+    Args:
+        symbol: Stock ticker symbol.
+        interval: Time interval (5minute, 10minute, hour, day, week).
+        span: Time span (day, week, month, 3month, year, 5year).
+
+    Returns:
+        Dict with symbol, interval, span, and equal-length lists begins_at,
+        open, high, low, close (floats), and volume.
+    """
+    symbol = _normalize_symbol(symbol)
+    rows = [row for row in get_historicals(symbol, interval, span) if isinstance(row, dict)]
+    columns: dict[str, Any] = {
+        "symbol": symbol,
+        "interval": interval,
+        "span": span,
+        "begins_at": [row.get("begins_at") for row in rows],
+    }
+    for column, key in _HISTORICAL_PRICE_COLUMNS:
+        columns[column] = [_to_float(row.get(key)) for row in rows]
+    columns["volume"] = [row.get("volume") for row in rows]
+    return columns
 
 
 def get_news(symbol: str) -> list[dict[str, Any]]:
@@ -439,7 +701,7 @@ def get_news(symbol: str) -> list[dict[str, Any]]:
     """
     symbol = _normalize_symbol(symbol)
     result = _safe_call(rh.stocks.get_news, symbol)
-    return result if isinstance(result, list) else []
+    return _as_list(result)
 
 
 def get_earnings(symbol: str) -> list[dict[str, Any]]:
@@ -452,8 +714,19 @@ def get_earnings(symbol: str) -> list[dict[str, Any]]:
         List of earnings reports with eps, report date, estimates, etc.
     """
     symbol = _normalize_symbol(symbol)
+    cached = _earnings_cache.get(symbol)
+    if cached is not None:
+        return cached
+
     result = _safe_call(rh.stocks.get_earnings, symbol)
-    return result if isinstance(result, list) else []
+    if not isinstance(result, list):
+        return []
+    # A failed request comes back as [None] (filtered to [] by robin_stocks),
+    # which is indistinguishable from "no earnings" - don't pin it for 24h.
+    reports = [row for row in result if row is not None]
+    if reports:
+        _earnings_cache.set(symbol, reports)
+    return reports
 
 
 def get_ratings(symbol: str) -> dict[str, Any]:
@@ -466,9 +739,14 @@ def get_ratings(symbol: str) -> dict[str, Any]:
         Ratings summary with buy, hold, sell counts and summary.
     """
     symbol = _normalize_symbol(symbol)
+    cached = _ratings_cache.get(symbol)
+    if cached is not None:
+        return cached
+
     result = _safe_call(rh.stocks.get_ratings, symbol)
 
     if isinstance(result, dict):
+        _ratings_cache.set(symbol, result)
         return result
     raise RobinhoodError(f"No ratings found for symbol: {symbol}")
 
@@ -517,7 +795,7 @@ def get_options_positions(account_number: str | None = None) -> list[dict[str, A
     """
     account_number = _normalize_account_number(account_number)
     result = _safe_call(rh.options.get_open_option_positions, **_account_kwargs(account_number))
-    return result if isinstance(result, list) else []
+    return _as_list(result)
 
 
 def search_symbols(query: str) -> list[dict[str, Any]]:
@@ -529,25 +807,28 @@ def search_symbols(query: str) -> list[dict[str, Any]]:
     Returns:
         List of matching instruments with symbol, name, etc.
     """
-    if not query or not isinstance(query, str):
+    if not isinstance(query, str) or not query.strip():
         raise RobinhoodError("Query must be a non-empty string")
 
     query = query.strip()
 
-    # Try to get instruments by the query
+    # Exact ticker match first. Both lookups share _safe_call's error policy;
+    # only a failed request falls through to the name search, anything else
+    # surfaces as RobinhoodError.
     try:
-        result = rh.stocks.get_instruments_by_symbols(query.upper())
-        if result and isinstance(result, list):
-            return result
-    except Exception:
-        pass
+        result = _safe_call(rh.stocks.get_instruments_by_symbols, query.upper())
+    except RobinhoodError as e:
+        if not isinstance(e.__cause__, requests_exceptions.RequestException):
+            raise
+        result = None
+    if type(result) is list and result:
+        return result
 
-    # If exact match fails, try search
     try:
-        result = rh.stocks.find_instrument_data(query)
-        return result if isinstance(result, list) else []
-    except Exception as e:
+        result = _safe_call(rh.stocks.find_instrument_data, query)
+    except RobinhoodError as e:
         raise RobinhoodError(f"Search failed: {e}") from e
+    return _as_list(result)
 
 
 # Instrument-URL -> symbol resolution. Mappings are immutable, so this cache
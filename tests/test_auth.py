@@ -2,15 +2,23 @@
 
 from unittest.mock import MagicMock, patch
 
+import pyotp
 import pytest
+import requests
 
+import robinhood_mcp.auth as auth_module
 from robinhood_mcp.auth import (
     _DEFAULT_APPROVAL_TIMEOUT_SECONDS,
     _MIN_APPROVAL_TIMEOUT_SECONDS,
     AuthenticationError,
     _approval_timeout_seconds,
     _clear_stale_pickle,
+    _configure_http_session,
+    _env_creds,
+    _load_env_once,
     _patched_validate_sherrif_id,
+    _reset_dotenv_cache,
+    _totp_for,
     get_totp_code,
     is_logged_in,
     login,
@@ -18,6 +26,18 @@ from robinhood_mcp.auth import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_env_caches():
+    """Reset cached .env state so each test sees its own patched environment."""
+    _reset_dotenv_cache()
+    _env_creds.cache_clear()
+    auth_module._totp_code_cache = None
+    yield
+    _reset_dotenv_cache()
+    _env_creds.cache_clear()
+    auth_module._totp_code_cache = None
+
+
 class TestGetTotpCode:
     """Tests for get_totp_code function."""
 
@@ -41,6 +61,84 @@ class TestGetTotpCode:
         with pytest.raises(AuthenticationError):
             get_totp_code("not-valid-base32!!!")
 
+    def test_reuses_totp_instance_for_same_secret(self):
+        """Repeated calls with one secret should share a single pyotp.TOTP."""
+        _totp_for.cache_clear()
+
+        get_totp_code("JBSWY3DPEHPK3PXP")
+        get_totp_code("JBSWY3DPEHPK3PXP")
+
+        info = _totp_for.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    @patch("robinhood_mcp.auth.time.time")
+    @patch("robinhood_mcp.auth._totp_for")
+    def test_reuses_code_within_window(self, mock_totp_for: MagicMock, mock_time: MagicMock):
+        """Calls inside one 30s window should compute the code only once."""
+        totp = mock_totp_for.return_value
+        totp.interval = 30
+        totp.at.side_effect = ["111111", "222222"]
+        mock_time.side_effect = [1_000_000_020.0, 1_000_000_049.9, 1_000_000_050.0]
+
+        assert get_totp_code("JBSWY3DPEHPK3PXP") == "111111"
+        assert get_totp_code("JBSWY3DPEHPK3PXP") == "111111"
+        assert get_totp_code("JBSWY3DPEHPK3PXP") == "222222"
+
+        assert [c.args for c in totp.at.call_args_list] == [(1_000_000_020,), (1_000_000_050,)]
+
+    def test_window_code_matches_pyotp(self):
+        """The cached path should produce the same code pyotp would."""
+        secret = "JBSWY3DPEHPK3PXP"
+
+        with patch("robinhood_mcp.auth.time.time", return_value=1_700_000_000.0):
+            code = get_totp_code(secret)
+
+        assert code == pyotp.TOTP(secret).at(1_700_000_000)
+
+
+class TestLoadEnvOnce:
+    """Tests for the process-wide .env loading guard."""
+
+    @patch("robinhood_mcp.auth.load_dotenv")
+    def test_parses_dotenv_only_once(self, mock_load_dotenv: MagicMock):
+        """Repeated calls should only read the .env file the first time."""
+        _load_env_once()
+        _load_env_once()
+
+        mock_load_dotenv.assert_called_once_with()
+
+    @patch("robinhood_mcp.auth.load_dotenv")
+    def test_reset_allows_reload(self, mock_load_dotenv: MagicMock):
+        """Resetting the guard should make the next call re-read .env."""
+        _load_env_once()
+        _reset_dotenv_cache()
+        _load_env_once()
+
+        assert mock_load_dotenv.call_count == 2
+
+
+class TestEnvCreds:
+    """Tests for the cached credential lookup."""
+
+    @patch.dict(
+        "os.environ",
+        {
+            "ROBINHOOD_USERNAME": "test@example.com",
+            "ROBINHOOD_PASSWORD": "secret",
+            "ROBINHOOD_TOTP_SECRET": "JBSWY3DPEHPK3PXP",
+        },
+        clear=True,
+    )
+    def test_reads_environment_once(self):
+        """Later environment changes should not be seen until the cache is cleared."""
+        assert _env_creds() == ("test@example.com", "secret", "JBSWY3DPEHPK3PXP")
+
+        with patch.dict("os.environ", {"ROBINHOOD_USERNAME": "other@example.com"}):
+            assert _env_creds()[0] == "test@example.com"
+            _env_creds.cache_clear()
+            assert _env_creds()[0] == "other@example.com"
+
 
 class TestLogin:
     """Tests for login function."""
@@ -224,6 +322,46 @@ class TestLogin:
         assert "Login failed: network down" in str(exc_info.value)
 
 
+class TestConfigureHttpSession:
+    """Tests for the shared robin_stocks HTTPS session tuning."""
+
+    @patch("robinhood_mcp.auth._HTTP_SESSION_CONFIGURED", False)
+    def test_mounts_pooled_retrying_adapter_once(self):
+        """Should mount one pooled adapter with retries, and only on first call."""
+        session = requests.Session()
+        with patch("robinhood_mcp.auth.rh_globals.SESSION", session):
+            _configure_http_session()
+            adapter = session.get_adapter("https://api.robinhood.com/")
+            _configure_http_session()
+
+            assert session.get_adapter("https://api.robinhood.com/") is adapter
+            assert auth_module._HTTP_SESSION_CONFIGURED is True
+
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 2
+        assert 429 in adapter.max_retries.status_forcelist
+        assert session.headers["Connection"] == "keep-alive"
+
+    @patch.dict(
+        "os.environ",
+        {"ROBINHOOD_USERNAME": "test@example.com", "ROBINHOOD_PASSWORD": "secret"},
+        clear=True,
+    )
+    @patch("robinhood_mcp.auth._HTTP_SESSION_CONFIGURED", False)
+    @patch("robinhood_mcp.auth.rh_globals.SESSION", object())
+    @patch("robinhood_mcp.auth.rh.login")
+    def test_tuning_failure_does_not_block_login(
+        self, mock_login: MagicMock, capsys: pytest.CaptureFixture[str]
+    ):
+        """A session that can't be tuned should warn and still log in."""
+        mock_login.return_value = {"access_token": "test"}
+
+        assert login() == {"access_token": "test"}
+
+        mock_login.assert_called_once()
+        assert "could not tune HTTP session" in capsys.readouterr().err
+
+
 class TestClearStalePickle:
     """Tests for stale session cache cleanup."""
 
@@ -249,28 +387,46 @@ class TestClearStalePickle:
 class TestLogout:
     """Tests for logout function."""
 
+    @patch("robinhood_mcp.auth.rh_helper.LOGGED_IN", True)
     @patch("robinhood_mcp.auth.rh.logout")
     def test_calls_robin_stocks_logout(self, mock_logout: MagicMock):
         """Should call robin_stocks logout."""
         logout()
         mock_logout.assert_called_once()
 
+    @patch("robinhood_mcp.auth.rh_helper.LOGGED_IN", False)
+    @patch("robinhood_mcp.auth.rh.logout")
+    def test_skips_logout_without_session(self, mock_logout: MagicMock):
+        """Should not call robin_stocks logout when there is no session."""
+        logout()
+        mock_logout.assert_not_called()
+
+    @patch("robinhood_mcp.auth.rh_helper.LOGGED_IN", True)
     @patch("robinhood_mcp.auth.rh.logout")
     def test_ignores_logout_errors(self, mock_logout: MagicMock):
-        """Should not raise on logout errors."""
-        mock_logout.side_effect = Exception("Network error")
+        """Should not raise on network errors during logout."""
+        mock_logout.side_effect = requests.exceptions.ConnectionError("Network error")
 
         # Should not raise
         logout()
 
+    @patch("robinhood_mcp.auth.rh_helper.LOGGED_IN", True)
+    @patch("robinhood_mcp.auth.rh.logout")
+    def test_propagates_unexpected_logout_errors(self, mock_logout: MagicMock):
+        """Programming errors should not be swallowed."""
+        mock_logout.side_effect = TypeError("bug")
+
+        with pytest.raises(TypeError):
+            logout()
+
 
 class TestPatchedValidationWorkflow:
     """Tests for the patched Robinhood verification workflow."""
 
     @patch("robinhood_mcp.auth.time.sleep", return_value=None)
     @patch("robinhood_mcp.auth.time.time", side_effect=range(0, 500, 5))
-    @patch("robinhood_mcp.auth.request_get")
-    @patch("robinhood_mcp.auth.request_post")
+    @patch("robinhood_mcp.auth.rh_helper.request_get")
+    @patch("robinhood_mcp.auth.rh_helper.request_post")
     def test_retries_when_prompt_status_response_is_empty(
         self,
         mock_request_post: MagicMock,
@@ -295,8 +451,8 @@ class TestPatchedValidationWorkflow:
 
     @patch("robinhood_mcp.auth.time.sleep", return_value=None)
     @patch("robinhood_mcp.auth.time.time", side_effect=range(0, 500, 5))
-    @patch("robinhood_mcp.auth.request_get")
-    @patch("robinhood_mcp.auth.request_post")
+    @patch("robinhood_mcp.auth.rh_helper.request_get")
+    @patch("robinhood_mcp.auth.rh_helper.request_post")
     def test_retries_when_workflow_result_is_empty_after_approval(
         self,
         mock_request_post: MagicMock,
@@ -322,8 +478,8 @@ class TestPatchedValidationWorkflow:
 
     @patch("robinhood_mcp.auth.time.sleep", return_value=None)
     @patch("robinhood_mcp.auth.time.time", side_effect=range(0, 500, 5))
-    @patch("robinhood_mcp.auth.request_get")
-    @patch("robinhood_mcp.auth.request_post")
+    @patch("robinhood_mcp.auth.rh_helper.request_get")
+    @patch("robinhood_mcp.auth.rh_helper.request_post")
     def test_retries_when_workflow_context_is_null_after_approval(
         self,
         mock_request_post: MagicMock,
@@ -0,0 +1,86 @@
+"""Tests for deferred module imports."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+from robinhood_mcp._lazy import LazyModule
+
+
+class TestLazyModule:
+    """Tests for the LazyModule proxy."""
+
+    def test_defers_import_until_attribute_access(self):
+        """Should not import the target module until an attribute is read."""
+        with patch.dict(sys.modules):
+            sys.modules.pop("colorsys", None)
+            proxy = LazyModule("colorsys")
+            assert "colorsys" not in sys.modules
+
+            assert proxy.rgb_to_hsv(0.0, 0.0, 0.0) == (0.0, 0.0, 0.0)
+            assert "colorsys" in sys.modules
+
+    def test_runs_on_load_hook_once(self):
+        """The on_load hook should run exactly once, with the imported module."""
+        on_load = MagicMock()
+        proxy = LazyModule("colorsys", on_load=on_load)
+
+        proxy.rgb_to_hsv
+        proxy.hsv_to_rgb
+
+        on_load.assert_called_once_with(sys.modules["colorsys"])
+
+    def test_supports_patching_through_proxy(self):
+        """patch() targets routed through the proxy should resolve and restore."""
+        proxy = LazyModule("colorsys")
+        original = proxy.rgb_to_hsv
+
+        with patch.object(proxy, "rgb_to_hsv") as mock_fn:
+            proxy.rgb_to_hsv(1, 2, 3)
+            mock_fn.assert_called_once_with(1, 2, 3)
+
+        assert proxy.rgb_to_hsv is original
+
+    def test_pins_submodules_but_not_functions(self):
+        """Submodule lookups are cached on the proxy; function lookups are not."""
+        proxy = LazyModule("os")
+
+        assert proxy.path is os.path
+        assert proxy.getcwd is os.getcwd
+
+        assert vars(proxy)["path"] is os.path
+        assert "getcwd" not in vars(proxy)
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_pinned_submodule_still_honours_patches(self, mock_quotes: MagicMock):
+        """Patching a function on a pinned submodule must reach proxy callers."""
+        from robinhood_mcp.tools import rh
+
+        rh.stocks.get_quotes("AAPL")
+
+        mock_quotes.assert_called_once_with("AAPL")
+
+
+class TestServerImport:
+    """The server module's import must stay free of robin_stocks."""
+
+    def test_server_import_does_not_load_robin_stocks(self):
+        """Importing the server must not pull in robin_stocks or requests.
+
+        Runs in a fresh interpreter: this test process has long since
+        imported both. A top-level ``rh.*`` reference anywhere in the
+        package would silently undo the lazy import and fail here.
+        """
+        script = (
+            "import sys\n"
+            "import robinhood_mcp.server\n"
+            "loaded = [m for m in ('robin_stocks', 'requests') if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
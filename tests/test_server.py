@@ -3,9 +3,15 @@
 These cover the failure-fast behavior added to `_ensure_logged_in()` so that
 a transient AuthenticationError (e.g. a Robinhood device-approval timeout)
 doesn't cause every subsequent tool call to re-run the full login flow and
-freeze the single-threaded MCP server.
+stall behind the login lock.
 """
 
+import asyncio
+import inspect
+import subprocess
+import sys
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -35,7 +41,34 @@ def reset_server_state():
 
 def _call_tool(tool, *args, **kwargs):
     """Call either a plain FastMCP function or a FunctionTool wrapper."""
-    return getattr(tool, "fn", tool)(*args, **kwargs)
+    result = getattr(tool, "fn", tool)(*args, **kwargs)
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+class TestStartup:
+    """Importing the server must stay cheap."""
+
+    def test_import_does_not_read_dotenv(self):
+        """.env is parsed by login() on the first tool call, not at import.
+
+        Checked in a fresh interpreter so the shared server module (its mcp
+        instance, tools, and locks) is left untouched for the other tests.
+        """
+        script = (
+            "import dotenv\n"
+            "calls = []\n"
+            "dotenv.load_dotenv = lambda *args, **kwargs: calls.append(args)\n"
+            "import robinhood_mcp.server\n"
+            "assert not calls, calls\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
 
 
 class TestEnsureLoggedInCooldown:
@@ -111,6 +144,160 @@ class TestEnsureLoggedInCooldown:
         assert "cached failure" not in str(exc_info.value)
 
 
+class TestEnsureLoggedInConcurrency:
+    """Concurrent tool calls share a single login attempt."""
+
+    @patch("robinhood_mcp.server.login")
+    def test_concurrent_calls_login_once(self, mock_login: MagicMock):
+        """Threads racing into _ensure_logged_in must not double-login."""
+        started = threading.Barrier(4)
+
+        def slow_login():
+            time.sleep(0.05)
+            return {"access_token": "ok"}
+
+        mock_login.side_effect = slow_login
+        errors: list[BaseException] = []
+
+        def worker():
+            started.wait()
+            try:
+                server._ensure_logged_in()
+            except BaseException as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert mock_login.call_count == 1
+
+
+class TestLoginStatusInvalidation:
+    """Tool failures drop the cached session status."""
+
+    @patch("robinhood_mcp.server.is_logged_in")
+    @patch("robinhood_mcp.server.login")
+    def test_cached_status_skips_profile_probe(
+        self, mock_login: MagicMock, mock_is_logged_in: MagicMock
+    ):
+        """Calls inside the TTL window must not re-probe Robinhood."""
+        mock_login.return_value = {"access_token": "ok"}
+
+        server._ensure_logged_in()
+        server._ensure_logged_in()
+        server._ensure_logged_in()
+
+        assert mock_login.call_count == 1
+        mock_is_logged_in.assert_not_called()
+
+    @patch("robinhood_mcp.server.get_quote")
+    @patch("robinhood_mcp.server.is_logged_in")
+    @patch("robinhood_mcp.server.login")
+    def test_tool_error_forces_fresh_probe(
+        self, mock_login: MagicMock, mock_is_logged_in: MagicMock, mock_get_quote: MagicMock
+    ):
+        """A RobinhoodError from a tool must make the next call re-check the session."""
+        mock_login.return_value = {"access_token": "ok"}
+        mock_is_logged_in.return_value = True
+        mock_get_quote.side_effect = RobinhoodError("API returned None - login first")
+
+        with pytest.raises(RobinhoodError):
+            _call_tool(server.robinhood_get_quote, "AAPL")
+        assert server._cached_login_status is None
+
+        mock_get_quote.side_effect = None
+        mock_get_quote.return_value = {"symbol": "AAPL"}
+        assert _call_tool(server.robinhood_get_quote, "AAPL") == {"symbol": "AAPL"}
+
+        mock_is_logged_in.assert_called_once_with()
+        assert mock_login.call_count == 1
+
+
+class TestEventLoopResponsiveness:
+    """Tool error handling must never block the event loop on _login_lock."""
+
+    @patch("robinhood_mcp.server._ensure_logged_in")
+    async def test_tool_error_does_not_wait_for_login_lock(self, mock_ensure: MagicMock):
+        """A failing tool returns promptly while another thread holds the login lock."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        def failing_tool():
+            raise RobinhoodError("API returned None - login first")
+
+        held = threading.Event()
+
+        def hold_login_lock():
+            # Stands in for a slow login (profile probe / device approval).
+            with server._login_lock:
+                held.set()
+                time.sleep(1.0)
+
+        holder = threading.Thread(target=hold_login_lock)
+        holder.start()
+        held.wait()
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            started = time.monotonic()
+            with pytest.raises(RobinhoodError):
+                await server._run_tool(failing_tool)
+            await asyncio.sleep(0.1)
+            elapsed = time.monotonic() - started
+        finally:
+            ticker_task.cancel()
+            holder.join()
+
+        assert elapsed < 0.5
+        assert ticks > 0
+        assert server._cached_login_status is None
+
+
+class TestToolConcurrencyCap:
+    """_tool_semaphore bounds how many tool calls reach Robinhood at once."""
+
+    @patch("robinhood_mcp.server._tool_semaphore", new_callable=lambda: asyncio.Semaphore(2))
+    @patch("robinhood_mcp.server.get_quote")
+    @patch("robinhood_mcp.server._ensure_logged_in")
+    async def test_in_flight_calls_never_exceed_cap(
+        self, mock_ensure: MagicMock, mock_get_quote: MagicMock, _semaphore
+    ):
+        """Launching more calls than the cap must queue the excess.
+
+        Uses a 2-slot semaphore so the cap sits below the default executor's
+        worker count and is what actually bounds the calls.
+        """
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def quote(symbol):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return {"symbol": symbol}
+
+        mock_get_quote.side_effect = quote
+        tool = getattr(server.robinhood_get_quote, "fn", server.robinhood_get_quote)
+
+        results = await asyncio.gather(*(tool(f"SYM{i}") for i in range(6)))
+
+        assert len(results) == 6
+        assert peak == 2
+
+
 class TestAccountNumberForwarding:
     """Server wrappers forward optional account selection to tool functions."""
 
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 import robinhood_mcp.tools as tools_module
 from robinhood_mcp.tools import (
@@ -10,14 +11,18 @@ from robinhood_mcp.tools import (
     get_dividends,
     get_earnings,
     get_fundamentals,
+    get_fundamentals_batch,
     get_historicals,
+    get_historicals_columnar,
     get_news,
     get_options_positions,
     get_order_history,
     get_portfolio,
     get_position,
     get_positions,
+    get_positions_with_quotes,
     get_quote,
+    get_quotes_batch,
     get_ratings,
     get_watchlist,
     search_symbols,
@@ -32,6 +37,14 @@ def clear_positions_cache():
     tools_module._clear_positions_cache()
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Reset the per-symbol response caches between tests."""
+    tools_module._clear_response_caches()
+    yield
+    tools_module._clear_response_caches()
+
+
 @pytest.fixture(autouse=True)
 def clear_symbol_cache():
     """Reset the instrument-URL to symbol cache between tests."""
@@ -188,6 +201,35 @@ class TestGetPortfolio:
             get_portfolio()
         assert "login" in str(exc_info.value).lower()
 
+    @patch("robinhood_mcp.tools.rh.profiles.load_portfolio_profile")
+    def test_wraps_request_errors(self, mock_profile: MagicMock):
+        """Network failures should surface as RobinhoodError."""
+        mock_profile.side_effect = requests.exceptions.ConnectionError("reset")
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_portfolio()
+        assert "API call failed" in str(exc_info.value)
+
+    @patch("robinhood_mcp.tools.rh.profiles.load_portfolio_profile")
+    def test_wraps_none_payload_type_errors(self, mock_profile: MagicMock):
+        """robin_stocks failing on a swallowed HTTP error should become RobinhoodError."""
+        mock_profile.side_effect = TypeError("'NoneType' object is not subscriptable")
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_portfolio()
+        assert isinstance(exc_info.value.__cause__, TypeError)
+
+    @patch("robinhood_mcp.tools.rh.profiles.load_portfolio_profile")
+    def test_wraps_login_required_errors(self, mock_profile: MagicMock):
+        """robin_stocks' bare login-required Exception should become RobinhoodError."""
+        mock_profile.side_effect = Exception(
+            "load_portfolio_profile can only be called when logged in"
+        )
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_portfolio()
+        assert "logged in" in str(exc_info.value)
+
 
 class TestGetPositions:
     """Tests for get_positions function."""
@@ -416,6 +458,56 @@ class TestGetPositions:
         mock_get_quote.assert_not_called()
 
 
+class TestGetPositionsWithQuotes:
+    """Tests for get_positions_with_quotes function."""
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    @patch("robinhood_mcp.tools.rh.account.build_holdings")
+    def test_attaches_quotes_from_one_batch_call(
+        self, mock_holdings: MagicMock, mock_quotes: MagicMock
+    ):
+        """Should fetch every held symbol's quote in a single request."""
+        mock_holdings.return_value = {
+            "AAPL": {"price": "175.00", "quantity": "10", "id": "internal"},
+            "TSLA": {"price": "250.00", "quantity": "5"},
+        }
+        mock_quotes.return_value = [{"symbol": "AAPL", "bid_price": "174.99"}]
+
+        result = get_positions_with_quotes()
+
+        assert result["AAPL"]["quantity"] == "10"
+        assert result["AAPL"]["quote"] == {"symbol": "AAPL", "bid_price": "174.99"}
+        assert "id" not in result["AAPL"]
+        assert result["TSLA"]["quote"] is None
+        mock_quotes.assert_called_once_with(["AAPL", "TSLA"])
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    @patch("robinhood_mcp.tools.rh.account.build_holdings")
+    def test_raises_when_quote_request_fails(
+        self, mock_holdings: MagicMock, mock_quotes: MagicMock
+    ):
+        """A failed batch quote request must not come back as all-None quotes."""
+        mock_holdings.return_value = {
+            "AAPL": {"price": "175.00", "quantity": "10"},
+            "TSLA": {"price": "250.00", "quantity": "5"},
+        }
+        mock_quotes.return_value = [None]
+
+        with pytest.raises(RobinhoodError):
+            get_positions_with_quotes()
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    @patch("robinhood_mcp.tools.rh.account.build_holdings")
+    def test_skips_quote_call_without_holdings(
+        self, mock_holdings: MagicMock, mock_quotes: MagicMock
+    ):
+        """An empty portfolio should not trigger a quote request."""
+        mock_holdings.return_value = {}
+
+        assert get_positions_with_quotes() == {}
+        mock_quotes.assert_not_called()
+
+
 class TestGetPosition:
     """Tests for get_position function."""
 
@@ -608,6 +700,12 @@ class TestGetQuote:
         with pytest.raises(RobinhoodError):
             get_quote(123)  # type: ignore
 
+    def test_raises_for_whitespace_only_symbol(self):
+        """Should reject symbols that are empty after stripping."""
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_quote("   ")
+        assert "non-empty string" in str(exc_info.value)
+
     @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
     def test_raises_for_no_results(self, mock_quotes: MagicMock):
         """Should raise RobinhoodError when no quote found."""
@@ -618,6 +716,156 @@ class TestGetQuote:
         assert "No quote found" in str(exc_info.value)
 
 
+class TestGetQuotesBatch:
+    """Tests for get_quotes_batch function."""
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_fetches_all_symbols_in_one_call(self, mock_quotes: MagicMock):
+        """Should normalize and de-duplicate symbols into a single API request."""
+        mock_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "175.00"},
+            {"symbol": "TSLA", "last_trade_price": "250.00"},
+        ]
+
+        result = get_quotes_batch([" aapl ", "TSLA", "AAPL"])
+
+        assert result == {
+            "AAPL": {"symbol": "AAPL", "last_trade_price": "175.00"},
+            "TSLA": {"symbol": "TSLA", "last_trade_price": "250.00"},
+        }
+        mock_quotes.assert_called_once_with(["AAPL", "TSLA"])
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_omits_unknown_symbols(self, mock_quotes: MagicMock):
+        """Unknown tickers are dropped by robin_stocks, so rows must be keyed by symbol."""
+        mock_quotes.return_value = [{"symbol": "TSLA", "last_trade_price": "250.00"}]
+
+        result = get_quotes_batch(["NOPE", "TSLA"])
+
+        assert result == {"TSLA": {"symbol": "TSLA", "last_trade_price": "250.00"}}
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_raises_on_failed_request_payload(self, mock_quotes: MagicMock):
+        """[None] from a failed or unauthorized request must not look like "all unknown"."""
+        mock_quotes.return_value = [None]
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_quotes_batch(["AAPL", "MSFT"])
+        assert "AAPL, MSFT" in str(exc_info.value)
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_rejects_empty_or_invalid_lists(self, mock_quotes: MagicMock):
+        """Should reject empty lists, non-lists, and lists with invalid symbols."""
+        for bad in ([], "AAPL", ["AAPL", ""], ["AAPL", 123]):
+            with pytest.raises(RobinhoodError):
+                get_quotes_batch(bad)  # type: ignore[arg-type]
+
+        mock_quotes.assert_not_called()
+
+
+class TestResponseCaches:
+    """Tests for the per-symbol TTL response caches."""
+
+    @patch("robinhood_mcp.tools.time.monotonic", side_effect=[100.0, 105.0])
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_quote_served_from_cache_within_ttl(
+        self, mock_quotes: MagicMock, _mock_monotonic: MagicMock
+    ):
+        """A repeat quote inside the TTL must not hit the API, and returns a copy."""
+        mock_quotes.return_value = [{"symbol": "AAPL", "last_trade_price": "175.00"}]
+
+        first = get_quote("AAPL")
+        first["last_trade_price"] = "mutated"
+        second = get_quote("aapl")
+
+        assert second == {"symbol": "AAPL", "last_trade_price": "175.00"}
+        mock_quotes.assert_called_once_with("AAPL")
+
+    @patch(
+        "robinhood_mcp.tools.time.monotonic",
+        side_effect=[100.0, 100.0 + tools_module._QUOTE_CACHE_TTL_SECONDS, 200.0],
+    )
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_quote_refetched_after_ttl(self, mock_quotes: MagicMock, _mock_monotonic: MagicMock):
+        """An expired quote entry must be refetched."""
+        mock_quotes.return_value = [{"symbol": "AAPL"}]
+
+        get_quote("AAPL")
+        get_quote("AAPL")
+
+        assert mock_quotes.call_count == 2
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_batch_fetches_only_uncached_symbols(self, mock_quotes: MagicMock):
+        """Batch lookups should reuse cached quotes and request only the misses."""
+        mock_quotes.side_effect = [
+            [{"symbol": "AAPL"}],
+            [{"symbol": "TSLA"}],
+        ]
+
+        get_quote("AAPL")
+        result = get_quotes_batch(["AAPL", "TSLA"])
+
+        assert result == {"AAPL": {"symbol": "AAPL"}, "TSLA": {"symbol": "TSLA"}}
+        assert mock_quotes.call_args_list[1].args == (["TSLA"],)
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_earnings")
+    @patch("robinhood_mcp.tools.rh.stocks.get_ratings")
+    @patch("robinhood_mcp.tools.rh.stocks.get_fundamentals")
+    def test_fundamentals_earnings_ratings_are_cached(
+        self, mock_fund: MagicMock, mock_ratings: MagicMock, mock_earnings: MagicMock
+    ):
+        """Slow-moving research data should be fetched once per symbol."""
+        mock_fund.return_value = [{"symbol": "AAPL", "pe_ratio": "25.5"}]
+        mock_ratings.return_value = {"summary": {"num_buy_ratings": 30}}
+        mock_earnings.return_value = [{"year": 2024, "quarter": 1}]
+
+        for _ in range(2):
+            get_fundamentals("AAPL")
+            get_ratings("AAPL")
+            get_earnings("AAPL")
+
+        mock_fund.assert_called_once()
+        mock_ratings.assert_called_once()
+        mock_earnings.assert_called_once()
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_failed_lookups_are_not_cached(self, mock_quotes: MagicMock):
+        """A missing quote must not be remembered as a result."""
+        mock_quotes.side_effect = [[], [{"symbol": "AAPL"}]]
+
+        with pytest.raises(RobinhoodError):
+            get_quote("AAPL")
+        assert get_quote("AAPL") == {"symbol": "AAPL"}
+
+    @patch("robinhood_mcp.tools.rh.account.build_holdings")
+    @patch("robinhood_mcp.tools.rh.stocks.get_quotes")
+    def test_clear_caches_forces_refetch(self, mock_quotes: MagicMock, mock_holdings: MagicMock):
+        """clear_caches should drop response and positions caches alike."""
+        mock_quotes.return_value = [{"symbol": "AAPL"}]
+        mock_holdings.return_value = {}
+
+        get_quote("AAPL")
+        get_positions()
+        assert tools_module.clear_caches() == {"cleared": True}
+        get_quote("AAPL")
+        get_positions()
+
+        assert mock_quotes.call_count == 2
+        assert mock_holdings.call_count == 2
+
+    def test_evicts_oldest_entry_when_full(self):
+        """The cache must stay bounded by dropping its oldest entry."""
+        cache = tools_module._TTLCache(ttl_seconds=60.0, maxsize=2)
+        cache.set("A", 1)
+        cache.set("B", 2)
+        cache.set("C", 3)
+
+        assert cache.get("A") is None
+        assert cache.get("B") == 2
+        assert cache.get("C") == 3
+
+
 class TestGetHistoricals:
     """Tests for get_historicals function."""
 
@@ -639,7 +887,9 @@ class TestGetHistoricals:
         """Should raise RobinhoodError for invalid interval."""
         with pytest.raises(RobinhoodError) as exc_info:
             get_historicals("AAPL", interval="invalid")  # type: ignore
-        assert "Invalid interval" in str(exc_info.value)
+        assert str(exc_info.value) == (
+            "Invalid interval. Must be one of: 5minute, 10minute, hour, day, week"
+        )
 
     def test_raises_for_invalid_span(self):
         """Should raise RobinhoodError for invalid span."""
@@ -648,6 +898,59 @@ class TestGetHistoricals:
         assert "Invalid span" in str(exc_info.value)
 
 
+class TestGetHistoricalsColumnar:
+    """Tests for get_historicals_columnar function."""
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_stock_historicals")
+    def test_returns_parallel_columns(self, mock_hist: MagicMock):
+        """Should transpose rows into float-typed columns."""
+        mock_hist.return_value = [
+            {
+                "begins_at": "2026-01-02T00:00:00Z",
+                "open_price": "100.00",
+                "high_price": "106.00",
+                "low_price": "99.50",
+                "close_price": "105.00",
+                "volume": 1000000,
+                "session": "reg",
+                "interpolated": False,
+                "symbol": "AAPL",
+            },
+            {
+                "begins_at": "2026-01-05T00:00:00Z",
+                "open_price": "105.00",
+                "high_price": "",
+                "low_price": "104.00",
+                "close_price": "110.00",
+                "volume": 1200000,
+                "session": "reg",
+                "interpolated": False,
+                "symbol": "AAPL",
+            },
+        ]
+
+        result = get_historicals_columnar(" aapl ", interval="day", span="month")
+
+        assert result == {
+            "symbol": "AAPL",
+            "interval": "day",
+            "span": "month",
+            "begins_at": ["2026-01-02T00:00:00Z", "2026-01-05T00:00:00Z"],
+            "open": [100.0, 105.0],
+            "high": [106.0, None],
+            "low": [99.5, 104.0],
+            "close": [105.0, 110.0],
+            "volume": [1000000, 1200000],
+        }
+        mock_hist.assert_called_once_with("AAPL", interval="day", span="month")
+
+    def test_validates_like_row_form(self):
+        """Should reject invalid intervals before calling the API."""
+        with pytest.raises(RobinhoodError) as exc_info:
+            get_historicals_columnar("AAPL", interval="invalid")  # type: ignore
+        assert "Invalid interval" in str(exc_info.value)
+
+
 class TestGetFundamentals:
     """Tests for get_fundamentals function."""
 
@@ -662,6 +965,34 @@ class TestGetFundamentals:
         assert result == expected
 
 
+class TestGetFundamentalsBatch:
+    """Tests for get_fundamentals_batch function."""
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_fundamentals")
+    def test_fetches_all_symbols_in_one_call(self, mock_fund: MagicMock):
+        """Should return fundamentals keyed by symbol from a single API request."""
+        mock_fund.return_value = [
+            {"symbol": "GOOGL", "pe_ratio": "22.1"},
+            {"symbol": "META", "pe_ratio": "27.4"},
+        ]
+
+        result = get_fundamentals_batch(["googl", "meta"])
+
+        assert result == {
+            "GOOGL": {"symbol": "GOOGL", "pe_ratio": "22.1"},
+            "META": {"symbol": "META", "pe_ratio": "27.4"},
+        }
+        mock_fund.assert_called_once_with(["GOOGL", "META"])
+
+    @patch("robinhood_mcp.tools.rh.stocks.get_fundamentals")
+    def test_raises_on_failed_request_payload(self, mock_fund: MagicMock):
+        """[None] from a failed request should raise instead of returning {}."""
+        mock_fund.return_value = [None]
+
+        with pytest.raises(RobinhoodError):
+            get_fundamentals_batch(["GOOGL", "META"])
+
+
 class TestGetNews:
     """Tests for get_news function."""
 
@@ -678,6 +1009,13 @@ class TestGetNews:
 
         assert result == expected
 
+    @patch("robinhood_mcp.tools.rh.stocks.get_news")
+    def test_returns_empty_list_for_non_list_payload(self, mock_news: MagicMock):
+        """Should normalize unexpected payload shapes to an empty list."""
+        mock_news.return_value = {"detail": "unexpected"}
+
+        assert get_news("AAPL") == []
+
 
 class TestGetEarnings:
     """Tests for get_earnings function."""
@@ -692,6 +1030,17 @@ class TestGetEarnings:
 
         assert result == expected
 
+    @patch("robinhood_mcp.tools.rh.stocks.get_earnings")
+    def test_failed_request_payload_is_not_cached(self, mock_earnings: MagicMock):
+        """[None] / [] from a swallowed HTTP error must not be cached for 24h."""
+        reports = [{"year": "2024", "quarter": "Q4"}]
+        mock_earnings.side_effect = [[None], [], reports]
+
+        assert get_earnings("AAPL") == []
+        assert get_earnings("AAPL") == []
+        assert get_earnings("AAPL") == reports
+        assert mock_earnings.call_count == 3
+
 
 class TestGetRatings:
     """Tests for get_ratings function."""
@@ -805,9 +1154,85 @@ class TestSearchSymbols:
 
     def test_raises_for_empty_query(self):
         """Should raise RobinhoodError for empty query."""
+        for query in ("", "   "):
+            with pytest.raises(RobinhoodError) as exc_info:
+                search_symbols(query)
+            assert "non-empty string" in str(exc_info.value)
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_skips_name_search_on_exact_match(
+        self, mock_instruments: MagicMock, mock_find: MagicMock
+    ):
+        """An exact ticker hit must not issue the second search request."""
+        mock_instruments.return_value = [{"symbol": "AAPL"}]
+
+        search_symbols(" aapl ")
+
+        mock_instruments.assert_called_once_with("AAPL")
+        mock_find.assert_not_called()
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_falls_back_to_name_search(self, mock_instruments: MagicMock, mock_find: MagicMock):
+        """No exact ticker match should fall back to the name search."""
+        mock_instruments.return_value = []
+        mock_find.return_value = [{"symbol": "CCL", "name": "Carnival Corp"}]
+
+        result = search_symbols(" carnival ")
+
+        assert result == [{"symbol": "CCL", "name": "Carnival Corp"}]
+        mock_find.assert_called_once_with("carnival")
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_falls_back_when_exact_lookup_request_fails(
+        self, mock_instruments: MagicMock, mock_find: MagicMock
+    ):
+        """A failed exact-lookup request should still try the name search."""
+        mock_instruments.side_effect = requests.exceptions.ConnectionError("boom")
+        mock_find.return_value = [{"symbol": "CCL"}]
+
+        assert search_symbols("carnival") == [{"symbol": "CCL"}]
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_wraps_name_search_request_errors(
+        self, mock_instruments: MagicMock, mock_find: MagicMock
+    ):
+        """A failed name search should raise RobinhoodError."""
+        mock_instruments.return_value = []
+        mock_find.side_effect = requests.exceptions.Timeout("slow")
+
         with pytest.raises(RobinhoodError) as exc_info:
-            search_symbols("")
-        assert "non-empty string" in str(exc_info.value)
+            search_symbols("carnival")
+        assert "Search failed" in str(exc_info.value)
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_does_not_fall_back_on_non_request_errors(
+        self, mock_instruments: MagicMock, mock_find: MagicMock
+    ):
+        """Non-request errors in the exact lookup surface as RobinhoodError."""
+        mock_instruments.side_effect = Exception(
+            "get_instruments_by_symbols can only be called when logged in"
+        )
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            search_symbols("AAPL")
+        assert "logged in" in str(exc_info.value)
+        mock_find.assert_not_called()
+
+    @patch("robinhood_mcp.tools.rh.stocks.find_instrument_data")
+    @patch("robinhood_mcp.tools.rh.stocks.get_instruments_by_symbols")
+    def test_wraps_name_search_type_errors(self, mock_instruments: MagicMock, mock_find: MagicMock):
+        """robin_stocks failing on a None payload should raise RobinhoodError."""
+        mock_instruments.return_value = []
+        mock_find.side_effect = TypeError("object of type 'NoneType' has no len()")
+
+        with pytest.raises(RobinhoodError) as exc_info:
+            search_symbols("carnival")
+        assert "Search failed" in str(exc_info.value)
 
 
 class TestGetOrderHistory: